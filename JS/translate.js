@@ -15,6 +15,13 @@ const TRANSLATION_CONFIG = {
     // Storage key for language preference
     STORAGE_KEY: 'selectedLanguage',
 
+    // Storage key for cached translations (per target language);
+    // bump the version to invalidate entries cached by older deploys
+    CACHE_STORAGE_KEY: 'translationCache:v1',
+
+    // How long cached translations stay valid (in milliseconds)
+    CACHE_TTL: 24 * 60 * 60 * 1000, // 24 hours
+
     // Default language mappings (fallback if API fails)
     DEFAULT_LANGUAGES: {
         'en': { name: 'English', flag: '🇬🇧' },
@@ -37,6 +44,9 @@ const originalTexts = new Map();
 // Current selected language
 let currentLanguage = TRANSLATION_CONFIG.DEFAULT_LANGUAGE;
 
+// Cached translations keyed by target language (persisted in localStorage)
+const translationCache = loadTranslationCache();
+
 /**
  * Initialize the translation module
  */
@@ -265,8 +275,13 @@ async function translatePage(targetLanguage) {
             textKeys.push(key);
         });
 
-        // Call translation API
-        const translations = await callTranslationAPI(textsToTranslate, targetLanguage);
+        // Reuse cached translations if the page texts are unchanged,
+        // otherwise call translation API and cache the result
+        let translations = getCachedTranslations(textsToTranslate, targetLanguage);
+        if (!translations) {
+            translations = await callTranslationAPI(textsToTranslate, targetLanguage);
+            cacheTranslations(textsToTranslate, targetLanguage, translations);
+        }
 
         // Update DOM with translations
         updatePageWithTranslations(translations, textKeys);
@@ -283,6 +298,74 @@ async function translatePage(targetLanguage) {
     }
 }
 
+/**
+ * Load cached translations from localStorage
+ * @returns {Object} - Map of language code to { texts, translations }
+ */
+function loadTranslationCache() {
+    try {
+        const cached = localStorage.getItem(TRANSLATION_CONFIG.CACHE_STORAGE_KEY);
+        const parsed = cached ? JSON.parse(cached) : null;
+        return parsed && typeof parsed === 'object' ? parsed : {};
+    } catch (error) {
+        console.warn('Error loading translation cache, starting empty:', error);
+        return {};
+    }
+}
+
+/**
+ * Get cached translations for the given texts
+ * @param {Array<string>} texts - Array of texts to translate
+ * @param {string} targetLanguage - Target language code
+ * @returns {Array<string>|null} - Cached translations, or null on a miss
+ */
+function getCachedTranslations(texts, targetLanguage) {
+    const entry = translationCache[targetLanguage];
+    if (!entry) {
+        return null;
+    }
+
+    // Drop expired or malformed entries so they are not reused
+    const isFresh = typeof entry.cachedAt === 'number' &&
+        Date.now() - entry.cachedAt < TRANSLATION_CONFIG.CACHE_TTL;
+    const isValid = Array.isArray(entry.texts) &&
+        Array.isArray(entry.translations) &&
+        entry.translations.length === entry.texts.length;
+    if (!isFresh || !isValid) {
+        delete translationCache[targetLanguage];
+        saveTranslationCache();
+        return null;
+    }
+
+    // Cached translations are only valid for the exact same source texts
+    const matches = entry.texts.length === texts.length &&
+        entry.texts.every((text, index) => text === texts[index]);
+    return matches ? entry.translations : null;
+}
+
+/**
+ * Store translations in the cache and persist it to localStorage
+ * @param {Array<string>} texts - Array of source texts
+ * @param {string} targetLanguage - Target language code
+ * @param {Array<string>} translations - Array of translated texts
+ */
+function cacheTranslations(texts, targetLanguage, translations) {
+    translationCache[targetLanguage] = { texts, translations, cachedAt: Date.now() };
+    saveTranslationCache();
+}
+
+/**
+ * Persist the translation cache to localStorage
+ */
+function saveTranslationCache() {
+    try {
+        localStorage.setItem(TRANSLATION_CONFIG.CACHE_STORAGE_KEY, JSON.stringify(translationCache));
+    } catch (error) {
+        // Storage may be full or unavailable; the in-memory cache still applies
+        console.warn('Error saving translation cache:', error);
+    }
+}
+
 /**
  * Call the translation API
  * @param {Array<string>} texts - Array of texts to translate
@@ -347,19 +430,28 @@ async function callTranslationAPI(texts, targetLanguage) {
  * @param {Array<string>} keys - Array of element keys
  */
 function updatePageWithTranslations(translations, keys) {
-    translations.forEach((translation, index) => {
-        const key = keys[index];
+    // Map keys to translations so the DOM is scanned once per attribute
+    // instead of once per key
+    const translationsByKey = new Map();
+    keys.forEach((key, index) => {
+        translationsByKey.set(key, translations[index]);
+    });
 
-        // Update text content elements
-        const textElement = document.querySelector(`[data-translate="${key}"]`);
-        if (textElement) {
-            textElement.textContent = translation;
+    // Update text content elements
+    const textElements = document.querySelectorAll('[data-translate]');
+    textElements.forEach(element => {
+        const key = element.getAttribute('data-translate');
+        if (translationsByKey.has(key)) {
+            element.textContent = translationsByKey.get(key);
         }
+    });
 
-        // Update placeholder elements
-        const placeholderElement = document.querySelector(`[data-translate-placeholder="${key}"]`);
-        if (placeholderElement) {
-            placeholderElement.placeholder = translation;
+    // Update placeholder elements
+    const placeholderElements = document.querySelectorAll('[data-translate-placeholder]');
+    placeholderElements.forEach(element => {
+        const key = element.getAttribute('data-translate-placeholder');
+        if (translationsByKey.has(key)) {
+            element.placeholder = translationsByKey.get(key);
         }
     });
 }
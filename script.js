@@ -151,11 +151,9 @@ async function submitPrompt() {
             throw new Error('User not authenticated. Please login.');
         }
 
-        // Get or create session
+        // Start a session if the one from page load is missing
         if (!state.sessionId) {
-            const session = await startSession();
-            state.sessionId = session.id;
-            setSessionId(session.id);
+            await startPageSession();
         }
 
         console.log('Submitting:', {
@@ -237,6 +235,17 @@ async function submitPrompt() {
     }
 }
 
+/**
+ * Starts a new session and records it in page state
+ * (startSession also persists the ID to localStorage)
+ * @returns {Promise<string>} Session ID
+ */
+async function startPageSession() {
+    const session = await startSession();
+    state.sessionId = session.id;
+    return session.id;
+}
+
 /**
  * Get user info from backend (for interest_field, etc.)
  * TODO: Create a user info endpoint or use existing user endpoint
@@ -308,6 +317,9 @@ async function loadPastChats() {
 function displayChats(chats) {
     chatsList.innerHTML = '';
 
+    // Reference time shared by all timestamps in this render
+    const now = new Date();
+
     chats.forEach(chat => {
         const chatItem = document.createElement('div');
         chatItem.className = 'chat-item';
@@ -315,7 +327,7 @@ function displayChats(chats) {
 
         chatItem.innerHTML = `
             <div class="chat-title">${chat.title}</div>
-            <div class="chat-timestamp">${formatTimestamp(chat.timestamp)}</div>
+            <div class="chat-timestamp">${formatTimestamp(chat.timestamp, now)}</div>
         `;
 
         chatItem.addEventListener('click', () => loadChat(chat.id));
@@ -357,10 +369,11 @@ async function loadChat(chatId) {
 
 /**
  * Formats timestamp for display
+ * @param {string} timestamp - Timestamp to format
+ * @param {Date} now - Reference time (defaults to current time)
  */
-function formatTimestamp(timestamp) {
+function formatTimestamp(timestamp, now = new Date()) {
     const date = new Date(timestamp);
-    const now = new Date();
     const diff = now - date;
 
     // Less than 24 hours
@@ -389,10 +402,8 @@ document.addEventListener('DOMContentLoaded', async () => {
 
     // Start a new session when page loads
     try {
-        const session = await startSession();
-        state.sessionId = session.id;
-        setSessionId(session.id);
-        console.log('Session started:', session.id);
+        const sessionId = await startPageSession();
+        console.log('Session started:', sessionId);
     } catch (error) {
         console.error('Error starting session:', error);
     }